@@ -1,90 +1,439 @@
+import base64
 import configparser
+import io
+import locale
 import logging
 import os
 import queue
 import re
+import shutil
+import sqlite3
+import struct
 import subprocess
 import sys
+import tempfile
 import threading
 import time
 import tkinter as tk
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from logging.handlers import QueueHandler
 from pathlib import Path
 from tkinter import filedialog, messagebox, scrolledtext, ttk
 
-import pystray
-from PIL import Image, ImageDraw, ImageFont
 from qbittorrent import Client
 # Watchdog is no longer needed
 # from watchdog.events import FileSystemEventHandler
 # from watchdog.observers import Observer
 
-from style import Style
+from style import ICON_ICO_B64, Style
 
 # --- Platform Specific Imports ---
 IS_WINDOWS = sys.platform == "win32"
 if IS_WINDOWS:
+    import pythoncom
     import win32com.client
 
 
 # --- Configuration ---
 CONFIG_FILE = "config.ini"
 EXTRACTION_LOG_FILE = "extractions.log"
-SUPPORTED_ARCHIVE_EXTENSIONS = {".zip", ".rar", ".7z", ".tar", ".gz", ".bz2"}
+PROCESSED_DB_FILE = "processed_torrents.db"
+# Maximum number of GUI queue messages handled per poll
+GUI_DRAIN_LIMIT = 500
+# How often (ms) the Tk thread checks whether new GUI messages arrived
+GUI_WAKEUP_INTERVAL_MS = 50
+# Settings edits are saved once they have been quiet for this long (ms)
+CONFIG_SAVE_DELAY_MS = 500
+# Tcl lambda that inserts history rows given as a flat {name bg fg ...} list
+# and colours them, so a whole batch costs a single Python -> Tcl call.
+HISTORY_INSERT_LAMBDA = """{listbox rows} {
+    foreach {name bg fg} $rows {
+        $listbox insert end $name
+        if {$bg ne ""} {
+            $listbox itemconfigure end -background $bg -foreground $fg
+        }
+    }
+}"""
+SUPPORTED_ARCHIVE_EXTENSIONS = frozenset({".zip", ".rar", ".7z", ".tar", ".gz", ".bz2"})
 PART_REGEX = re.compile(r"(.+?)\.(part\d{1,3}|[rs]\d{2}|z\d{2}|\d{3})$", re.IGNORECASE)
+# Cheap pre-check so PART_REGEX only runs on names that can actually match it.
+_MAYBE_PART = re.compile(r"\.(r\d\d|s\d\d|z\d\d|part\d{1,3}|\d{3})$", re.IGNORECASE)
+# Independent archive sets within a torrent are extracted concurrently.
+MAX_EXTRACTION_WORKERS = min(4, os.cpu_count() or 2)
+# Deleting parts is IO-bound, so more workers help on slow or network storage.
+MAX_DELETE_WORKERS = 8
+# Used when removing all extracted folders from the history.
+MAX_DATA_DELETE_WORKERS = 16
+# Torrents whose unpacking keeps raising are given up on after this many tries.
+MAX_UNPACK_ATTEMPTS = 3
+
+
+@lru_cache(maxsize=8192)
+def _classify(name):
+    """Returns the archive set a file name belongs to, or None if it is not an archive."""
+    stem, ext = os.path.splitext(name)
+    ext = ext.lower()
+    if ext not in SUPPORTED_ARCHIVE_EXTENSIONS and not (_MAYBE_PART.match(ext) and PART_REGEX.match(name)):
+        return None
+
+    # For filenames like "archive.part1.rar", the stem is "archive.part1".
+    # For ".rar, .r00, .r01" sets, the stem is already the shared base name.
+    match = PART_REGEX.match(stem)
+    return match.group(1) if match else stem
+
+
+@lru_cache(maxsize=None)
+def _get_icon_bytes():
+    """Returns the embedded application icon as ICO file bytes."""
+    return base64.b64decode(ICON_ICO_B64)
+
+
+@lru_cache(maxsize=None)
+def _get_icon_png_b64():
+    """Returns the largest PNG frame of the embedded icon, base64 encoded.
+
+    The ICO frames are stored as PNGs, so Tk can use one directly without
+    decoding the ICO container through Pillow.
+    """
+    data = _get_icon_bytes()
+    _, _, count = struct.unpack_from('<HHH', data)
+    frames = []
+    for i in range(count):
+        width, _, _, _, _, _, size, offset = struct.unpack_from('<BBBBHHII', data, 6 + 16 * i)
+        frame = data[offset:offset + size]
+        if frame.startswith(b'\x89PNG'):
+            frames.append((width or 256, frame)) # A width of 0 means 256 px
+    return base64.b64encode(max(frames)[1]).decode('ascii')
+
+
+@lru_cache(maxsize=None)
+def _get_icon_image():
+    """Returns the application icon as a PIL image for the tray, decoded only once."""
+    from PIL import Image # Imported lazily; Pillow is slow to load
+    return Image.open(io.BytesIO(_get_icon_bytes()))
+
+
+def _iter_files(root):
+    """Yields (name, path) for every regular file below root, without following symlinks."""
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry.name, entry.path
+        except OSError as e:
+            # Like os.walk, skip folders that cannot be read (locked, or
+            # removed while walking) instead of aborting the whole scan.
+            logging.getLogger(__name__).warning("Could not scan folder %s: %s", folder, e)
+
+
+def _safe_unlink(path):
+    """Deletes a file, returning the OSError instead of raising it."""
+    try:
+        os.unlink(path)
+        return None
+    except OSError as e:
+        return e
+
+
+def _delete_path(path):
+    """Deletes a folder tree or a file.
+
+    Returns (kind, error) where kind is 'folder', 'file' or None if nothing
+    existed at path, and error is the OSError raised while deleting, if any.
+    """
+    try:
+        shutil.rmtree(path)
+        return 'folder', None
+    except NotADirectoryError:
+        pass
+    except FileNotFoundError:
+        return None, None
+    except OSError as e:
+        return 'folder', e
+
+    # Handle cases where the path might be a file (less likely)
+    try:
+        os.unlink(path)
+        return 'file', None
+    except FileNotFoundError:
+        return None, None
+    except OSError as e:
+        return 'file', e
+
+
+def _failed_batch_archives(output):
+    """Returns the archives a multi-archive 7-Zip run reported errors for.
+
+    output is 7-Zip's combined stdout/stderr, in which each archive's
+    messages follow an 'Extracting archive: <path>' line. Paths are
+    returned normcase'd and normalised.
+    """
+    failed = set()
+    current = None
+    for line in output.splitlines():
+        if line.startswith("Extracting archive: "):
+            current = os.path.normcase(os.path.normpath(line[len("Extracting archive: "):].strip()))
+        elif current is not None and "ERROR" in line:
+            failed.add(current)
+    return failed
+
+
+def _is_within(path, root):
+    """Returns True if path is root itself or lies below it."""
+    try:
+        path.relative_to(root)
+        return True
+    except ValueError:
+        return False
+
+
+class _HistoryWriter(threading.Thread):
+    """Appends extraction history lines to the log file from a background thread."""
+    MAX_BATCH = 100
+
+    def __init__(self, log_file, logger):
+        super().__init__()
+        self.log_file = log_file
+        self.logger = logger
+        self.daemon = True
+        self._queue = queue.Queue()
+
+    # Queued by clear(); deletes the log file in order with the writes.
+    _CLEAR = object()
+
+    def write(self, line):
+        self._queue.put(line)
+
+    def clear(self):
+        """Deletes the log file, dropping lines queued before this call."""
+        self._queue.put(self._CLEAR)
+
+    def run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            # Drain whatever else is pending so it goes out in a single write.
+            lines = []
+            while True:
+                if item is None:
+                    stopping = True
+                    break
+                if item is self._CLEAR:
+                    lines = [] # Not written yet, so there is nothing else to undo
+                    self._remove_log()
+                else:
+                    lines.append(item)
+                if len(lines) >= self.MAX_BATCH:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if not lines:
+                continue
+
+            try:
+                with open(self.log_file, 'a') as f:
+                    f.write(''.join(lines))
+                    f.flush()
+            except OSError as e:
+                self.logger.error("Failed to write extraction history: %s", e)
+
+    def _remove_log(self):
+        try:
+            os.remove(self.log_file)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.error("Failed to delete extraction history: %s", e)
+
+    def stop(self):
+        # Pending lines are still written before the thread exits.
+        self._queue.put(None)
+
+
+class ProcessedStore:
+    """Persistent set of torrent hashes that have already been processed."""
+
+    def __init__(self, path):
+        # The store is filled by the monitor thread but created on the Tk thread.
+        self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._db.execute('CREATE TABLE IF NOT EXISTS processed (hash TEXT PRIMARY KEY, added INTEGER)')
+        self._mem = {row[0] for row in self._db.execute('SELECT hash FROM processed')}
+        # Hashes currently being unpacked; kept in memory only, so an
+        # interrupted extraction is retried after a restart.
+        self._claimed = set()
+
+    def __contains__(self, torrent_hash):
+        return torrent_hash in self._mem
+
+    def __len__(self):
+        return len(self._mem)
+
+    def claim(self, torrent_hash):
+        """Reserves a torrent for unpacking.
+
+        Returns False if it was already processed or is being unpacked by
+        another monitor thread.
+        """
+        with self._lock:
+            if torrent_hash in self._mem or torrent_hash in self._claimed:
+                return False
+            self._claimed.add(torrent_hash)
+            return True
+
+    def release(self, torrent_hash):
+        with self._lock:
+            self._claimed.discard(torrent_hash)
+
+    def add(self, torrent_hash):
+        if torrent_hash in self._mem:
+            return
+        self._mem.add(torrent_hash)
+        with self._lock:
+            self._db.execute('INSERT OR IGNORE INTO processed VALUES (?, ?)', (torrent_hash, int(time.time())))
+
+    def prune(self, older_than_days):
+        """Forgets hashes recorded more than older_than_days ago."""
+        cutoff = int(time.time()) - older_than_days * 86400
+        with self._lock:
+            self._db.execute('DELETE FROM processed WHERE added < ?', (cutoff,))
+            self._mem = {row[0] for row in self._db.execute('SELECT hash FROM processed')}
 
 
 class Unpacker:
     """Handles the logic for finding and extracting archives."""
 
-    def __init__(self, seven_zip_path, delete_on_success, logger, gui_queue, create_subfolder):
+    def __init__(self, seven_zip_path, delete_on_success, logger, gui_queue, create_subfolder, history_writer):
         self.seven_zip_path = seven_zip_path
         self.delete_on_success = delete_on_success
         self.logger = logger
         self.gui_queue = gui_queue
         self.create_subfolder = create_subfolder
+        self.history_writer = history_writer
+        self._progress_lock = threading.Lock()
+        self._active_extractions = 0
 
     def unpack_archives(self, path):
         """Finds and unpacks archives at the given path."""
+        # Candidates are kept as (base name, path string) pairs; Path objects
+        # are only created once they are grouped into archive sets.
         all_archives = []
         if path.is_file():
-            if path.suffix.lower() in SUPPORTED_ARCHIVE_EXTENSIONS or PART_REGEX.match(path.name):
-                all_archives.append(path)
+            base_name = _classify(path.name)
+            if base_name is not None:
+                all_archives.append((base_name, str(path)))
         elif path.is_dir():
-            for root, _, files in os.walk(path):
-                for file in files:
-                    file_path = Path(root) / file
-                    if file_path.suffix.lower() in SUPPORTED_ARCHIVE_EXTENSIONS or PART_REGEX.match(file_path.name):
-                        all_archives.append(file_path)
+            for name, entry_path in _iter_files(path):
+                base_name = _classify(name)
+                if base_name is not None:
+                    all_archives.append((base_name, entry_path))
 
         if not all_archives:
-            self.logger.info(f"No supported archives found in '{path}'.")
+            self.logger.info("No supported archives found in '%s'.", path)
             return
 
         archive_sets = defaultdict(list)
-        for archive in all_archives:
-            # For filenames like "archive.part1.rar", the stem is "archive.part1"
-            name_to_check = archive.stem
-            match = PART_REGEX.match(name_to_check)
-            if not match and archive.suffix.lower() == '.rar':
-                # For ".rar, .r00, .r01" sets, the base name is the same for all.
-                # The first file is ".rar", subsequent are ".rXX"
-                match = PART_REGEX.match(archive.name)
-
-            base_name = match.group(1) if match else archive.stem
-            archive_sets[base_name].append(archive)
+        for base_name, archive_path in all_archives:
+            archive_sets[base_name].append(Path(archive_path))
 
+        jobs = []
         for base_name, file_list in archive_sets.items():
             # For RAR sets, the primary file is the one with the .rar extension
             # or the lowest numbered part if .rar is not present.
             rar_files = [f for f in file_list if f.suffix.lower() == '.rar']
             if rar_files:
-                primary_file = rar_files[0]
+                primary_file = min(rar_files, key=lambda p: p.name)
             else:
-                primary_file = sorted(file_list)[0]
+                primary_file = min(file_list, key=lambda p: p.name)
 
-            self.logger.info(f"Found archive set '{base_name}' with {len(file_list)} parts. Starting with '{primary_file.name}'.")
-            self.extract_archive(primary_file, file_list, path.name)
+            self.logger.info("Found archive set '%s' with %s parts. Starting with '%s'.", base_name, len(file_list), primary_file.name)
+            jobs.append((base_name, primary_file, file_list))
+
+        # The progress bar runs once for the whole torrent rather than
+        # flickering on and off for every archive set.
+        self._begin_progress()
+        try:
+            if self.create_subfolder:
+                # Every set gets a fresh folder of its own, so all can run in parallel
+                groups = [[job] for job in jobs]
+            else:
+                # Sets in the same folder are extracted into that folder. Each
+                # folder is one task, so concurrent 7-Zip processes never write
+                # (or lock) the same files while folders still run in parallel.
+                by_dir = defaultdict(list)
+                for job in jobs:
+                    by_dir[job[1].parent].append(job)
+                groups = list(by_dir.values())
+
+            with ThreadPoolExecutor(max_workers=MAX_EXTRACTION_WORKERS) as executor:
+                for group in groups:
+                    executor.submit(self._extract_group, group, path.name)
+        finally:
+            self._end_progress()
+
+    def _extract_group(self, group, torrent_name):
+        """Extracts archive sets that share an output folder, isolating their failures."""
+        if len(group) > 1:
+            group = self._extract_batch(group, torrent_name)
+        for base_name, primary_file, file_list in group:
+            try:
+                self.extract_archive(primary_file, file_list, torrent_name)
+            except Exception as e:
+                self.logger.error("Extraction of archive set '%s' failed: %s", base_name, e)
+
+    def _extract_batch(self, jobs, torrent_name):
+        """Extracts archive sets that share an output folder with one 7-Zip run.
+
+        Without per-extraction subfolders every set is extracted next to its
+        archive, so sets in the same folder can go through a single process.
+        Returns the jobs that still have to be extracted one by one: all of
+        them if batching is not possible, otherwise the sets that failed.
+        """
+        # '*' and '?' would be treated as wildcards by the -ai switch
+        if any(c in job[1].name for job in jobs for c in '*?'):
+            return jobs
+
+        output_dir = jobs[0][1].parent
+        # -an disables the archive name argument; each -ai! adds one archive
+        # instead. Messages are merged into stdout (-bse1) and kept, so a
+        # failure can be attributed to the archives that caused it.
+        command = [self.seven_zip_path, "x", "-an", *[f"-ai!{job[1]}" for job in jobs], f"-o{output_dir}", "-y", "-bso1", "-bse1", "-bsp0", "-sccUTF-8"]
+        try:
+            self.gui_queue.put(('status', f"Extracting: {len(jobs)} archives"))
+            self.logger.info("Extracting %s archive sets in '%s' with a single 7-Zip run...", len(jobs), output_dir)
+            self._run_7zip(command, capture_output=True)
+            failed = set()
+        except subprocess.CalledProcessError as e:
+            failed = _failed_batch_archives(e.output or "")
+            if not failed:
+                # Nothing to attribute the failure to; retry every set
+                self.logger.warning("Batch extraction in '%s' failed (%s). Retrying each archive set separately.", output_dir, e)
+                return jobs
+            self.logger.warning("Batch extraction in '%s' failed for %s archive set(s). Retrying them separately.", output_dir, len(failed))
+        except OSError as e:
+            self.logger.warning("Batch extraction in '%s' failed (%s). Retrying each archive set separately.", output_dir, e)
+            return jobs
+
+        remaining = []
+        for job in jobs:
+            _, primary_file, file_list = job
+            if os.path.normcase(os.path.normpath(str(primary_file))) in failed:
+                remaining.append(job)
+                continue
+            self.logger.info("Successfully extracted '%s' to '%s'", primary_file.name, output_dir)
+            self._log_extraction_event('SUCCESS', torrent_name, str(output_dir))
+            if self.delete_on_success:
+                self._delete_parts(file_list)
+        return remaining
 
     def extract_archive(self, archive_path, all_parts, torrent_name):
         base_name = torrent_name
@@ -92,60 +441,87 @@ class Unpacker:
         if self.create_subfolder:
             output_dir = archive_path.parent / base_name
             counter = 1
-            # Create a unique directory name if the original one exists
-            while output_dir.exists():
-                output_dir = archive_path.parent / f"{base_name} ({counter})"
-                counter += 1
+            # Create a unique directory name if the original one exists.
+            # mkdir() doubles as the existence check so concurrent extractions
+            # can never claim the same directory.
+            while True:
+                try:
+                    output_dir.mkdir()
+                    break
+                except FileExistsError:
+                    output_dir = archive_path.parent / f"{base_name} ({counter})"
+                    counter += 1
             
             extraction_name = output_dir.name
-            # The directory is guaranteed not to exist at this point, so we create it.
-            output_dir.mkdir()
-            self.logger.info(f"Created extraction directory: '{output_dir}'")
+            self.logger.info("Created extraction directory: '%s'", output_dir)
         else:
             output_dir = archive_path.parent
             extraction_name = base_name
-            self.logger.info(f"Extracting archive to root folder: '{output_dir}'")
+            self.logger.info("Extracting archive to root folder: '%s'", output_dir)
 
-        command = [self.seven_zip_path, "x", str(archive_path), f"-o{output_dir}", "-y"]
+        # -bso0/-bsp0 silence 7-Zip's regular and progress output; only stderr is kept for error reporting.
+        command = [self.seven_zip_path, "x", str(archive_path), f"-o{output_dir}", "-y", "-bso0", "-bsp0"]
         try:
             self.gui_queue.put(('status', f"Extracting: {archive_path.name}"))
-            self.gui_queue.put(('progress', 'start'))
-            self.logger.info(f"Extracting '{archive_path.name}'...")
+            self.logger.info("Extracting '%s'...", archive_path.name)
+            self._run_7zip(command)
             
-            # Use CREATE_NO_WINDOW on Windows to prevent any console window from appearing
-            if IS_WINDOWS:
-                subprocess.run(command, check=True, capture_output=True, text=True, encoding='utf-8', errors='ignore', creationflags=subprocess.CREATE_NO_WINDOW)
-            else:
-                subprocess.run(command, check=True, capture_output=True, text=True, encoding='utf-8', errors='ignore')
-            
-            self.logger.info(f"Successfully extracted '{archive_path.name}' to '{output_dir}'")
+            self.logger.info("Successfully extracted '%s' to '%s'", archive_path.name, output_dir)
             self._log_extraction_event('SUCCESS', extraction_name, str(output_dir))
 
 
             if self.delete_on_success:
-                self.logger.info(f"Deleting {len(all_parts)} archive part(s)...")
-                for part in all_parts:
-                    try:
-                        os.remove(part)
-                        self.logger.info(f"Deleted '{part.name}'")
-                    except OSError as e:
-                        self.logger.error(f"Failed to delete '{part.name}': {e}")
+                self._delete_parts(all_parts)
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to extract '{archive_path.name}'.")
+            self.logger.error("Failed to extract '%s'.", archive_path.name)
             if e.stderr:
-                self.logger.error(f"7-Zip Output:\n{e.stderr}")
+                self.logger.error("7-Zip Output:\n%s", e.stderr)
             self._log_extraction_event('FAILURE', extraction_name, str(output_dir))
         except Exception as e:
-            self.logger.error(f"An unexpected error occurred during extraction: {e}")
+            self.logger.error("An unexpected error occurred during extraction: %s", e)
             self._log_extraction_event('FAILURE', extraction_name, str(output_dir))
-        finally:
-            self.gui_queue.put(('progress', 'stop'))
-            self.gui_queue.put(('status', "Monitoring..."))
+
+    def _run_7zip(self, command, capture_output=False):
+        """Runs a 7-Zip command, raising CalledProcessError (with stderr) on failure.
+
+        With capture_output, stdout is kept as well and available as the
+        error's output.
+        """
+        stdout = subprocess.PIPE if capture_output else subprocess.DEVNULL
+        # Use CREATE_NO_WINDOW on Windows to prevent any console window from appearing
+        if IS_WINDOWS:
+            subprocess.run(command, check=True, stdout=stdout, stderr=subprocess.PIPE, text=True, encoding='utf-8', errors='ignore', creationflags=subprocess.CREATE_NO_WINDOW)
+        else:
+            subprocess.run(command, check=True, stdout=stdout, stderr=subprocess.PIPE, text=True, encoding='utf-8', errors='ignore')
+
+    def _delete_parts(self, all_parts):
+        """Deletes the parts of a successfully extracted archive set."""
+        self.logger.info("Deleting %s archive part(s)...", len(all_parts))
+        with ThreadPoolExecutor(max_workers=MAX_DELETE_WORKERS) as pool:
+            for part, error in zip(all_parts, pool.map(_safe_unlink, all_parts)):
+                if error:
+                    self.logger.error("Failed to delete '%s': %s", part.name, error)
+                else:
+                    self.logger.info("Deleted '%s'", part.name)
+
+    def _begin_progress(self):
+        """Starts the progress bar when the outermost extraction batch begins."""
+        with self._progress_lock:
+            self._active_extractions += 1
+            if self._active_extractions == 1:
+                self.gui_queue.put(('progress', 'start'))
+
+    def _end_progress(self):
+        """Stops the progress bar once the outermost extraction batch finishes."""
+        with self._progress_lock:
+            self._active_extractions -= 1
+            if self._active_extractions == 0:
+                self.gui_queue.put(('progress', 'stop'))
+                self.gui_queue.put(('status', "Monitoring..."))
 
     def _log_extraction_event(self, status, name, path):
         """Logs an extraction event to the history file and GUI queue."""
-        with open(EXTRACTION_LOG_FILE, 'a') as f:
-            f.write(f"{status}:{name}:{path}\n")
+        self.history_writer.write(f"{status}:{name}:{path}\n")
         
         if status == 'SUCCESS':
             self.gui_queue.put(('extraction_success', (name, path)))
@@ -153,19 +529,61 @@ class Unpacker:
             self.gui_queue.put(('extraction_failure', (name, path)))
 
 
-class QueueHandler(logging.Handler):
-    """Class to send logging records to a queue."""
-    def __init__(self, gui_queue):
+class GuiQueue(queue.SimpleQueue):
+    """Queue for GUI messages that calls on_put (which must not touch Tk) after every put.
+
+    A SimpleQueue is enough since nothing joins it, and it avoids Queue's
+    lock and unfinished-task bookkeeping on every message.
+    """
+    def __init__(self, on_put):
         super().__init__()
-        self.gui_queue = gui_queue
+        self._on_put = on_put
+
+    def put(self, item, block=True, timeout=None):
+        super().put(item, block, timeout)
+        self._on_put()
+
+    def put_nowait(self, item):
+        # SimpleQueue.put_nowait does not go through put()
+        self.put(item, block=False)
+
 
-    def emit(self, record):
-        self.gui_queue.put(('log', self.format(record)))
+class RawQueueHandler(QueueHandler):
+    """QueueHandler that enqueues records unformatted.
+
+    The stdlib handler formats every record on the logging thread; here
+    that is left to whoever drains the queue, so %-style arguments stay lazy.
+    """
+    def prepare(self, record):
+        return record
+
+
+class ReadOnlyScrolledText(scrolledtext.ScrolledText):
+    """ScrolledText that ignores user edits but stays writable from code.
+
+    Unlike state="disabled", inserting text does not require toggling the
+    widget state around every insert. Text can still be selected and copied.
+    """
+    _NAVIGATION_KEYS = frozenset({'Left', 'Right', 'Up', 'Down', 'Prior', 'Next', 'Home', 'End'})
+
+    def __init__(self, master=None, **kw):
+        kw.setdefault('insertwidth', 0) # No blinking cursor in a read-only view
+        super().__init__(master, **kw)
+        self.bind("<Key>", self._on_key)
+        for event in ("<<Cut>>", "<<Paste>>", "<<PasteSelection>>", "<<Clear>>"):
+            self.bind(event, lambda e: "break")
+
+    def _on_key(self, event):
+        if event.keysym in self._NAVIGATION_KEYS:
+            return None
+        if event.state & 0x4 and event.keysym.lower() in ('a', 'c'): # Control-A / Control-C
+            return None
+        return "break"
 
 
 class UnpackMonitorThread(threading.Thread):
     """The main worker thread for monitoring and unpacking."""
-    def __init__(self, config, logger, processed_torrents, gui_queue):
+    def __init__(self, config, logger, processed_torrents, gui_queue, history_writer):
         super().__init__()
         self.config = config
         self.logger = logger
@@ -173,6 +591,7 @@ class UnpackMonitorThread(threading.Thread):
         self._stop_event = threading.Event()
         self.processed_torrents = processed_torrents
         self.gui_queue = gui_queue
+        self.history_writer = history_writer
 
     def run(self):
         qbt_config = self.config["qBittorrent"]
@@ -184,7 +603,7 @@ class UnpackMonitorThread(threading.Thread):
             self.logger.info("Successfully connected to qBittorrent.")
             self.gui_queue.put(('status', "Monitoring..."))
         except Exception as e:
-            self.logger.error(f"Could not connect to qBittorrent: {e}")
+            self.logger.error("Could not connect to qBittorrent: %s", e)
             self.gui_queue.put(('status', "Error: Connection Failed"))
             return
 
@@ -195,50 +614,110 @@ class UnpackMonitorThread(threading.Thread):
         delete_on_success = self.config.getboolean("General", "delete_on_success", fallback=False)
         create_subfolder = self.config.getboolean("General", "create_subfolder", fallback=True)
 
-        unpacker = Unpacker(seven_zip_path, delete_on_success, self.logger, self.gui_queue, create_subfolder)
+        unpacker = Unpacker(seven_zip_path, delete_on_success, self.logger, self.gui_queue, create_subfolder, self.history_writer)
         
-        self.logger.info(f"Starting real-time monitoring of: {monitor_path_str}")
-        self.logger.info("Polling qBittorrent for completed torrents every 15 seconds...")
+        self.logger.info("Starting real-time monitoring of: %s", monitor_path_str)
+        self.logger.info("Syncing with qBittorrent for completed torrents every second...")
+
+        # Resolve the monitored root once instead of once per torrent per poll.
+        monitor_root = monitor_path.resolve()
+        # Normalised form for a purely lexical check that avoids resolve()
+        # (and its filesystem lookups) for the common case.
+        monitor_norm = os.path.normcase(os.path.normpath(monitor_path_str))
+        monitor_prefix = monitor_norm if monitor_norm.endswith(os.sep) else monitor_norm + os.sep
+
+        # State for qBittorrent's incremental sync API. Each response only
+        # contains the torrents (and fields) that changed since 'rid'.
+        rid = 0
+        torrents = {}
+        # hash -> number of unpack attempts that raised
+        unpack_failures = defaultdict(int)
+        # hash -> (content_path, inside monitored folder). Seeding torrents
+        # show up in almost every delta, so the check is only redone when
+        # their content_path changes.
+        in_monitor = {}
 
         while not self._stop_event.is_set():
             try:
+                main_data = qbt_client.sync_main_data(rid=rid)
+                rid = main_data.get('rid', rid)
+                if main_data.get('full_update'):
+                    torrents.clear()
+                    in_monitor.clear()
+                for torrent_hash in main_data.get('torrents_removed', []):
+                    torrents.pop(torrent_hash, None)
+                    in_monitor.pop(torrent_hash, None)
+
                 torrents_to_process = []
-                for torrent in qbt_client.torrents():
+                for torrent_hash, changes in main_data.get('torrents', {}).items():
+                    torrent = torrents.setdefault(torrent_hash, {'hash': torrent_hash})
+                    torrent.update(changes)
                     # Check if torrent is complete, not already processed, and in the monitored path
-                    if torrent["progress"] == 1 and torrent['hash'] not in self.processed_torrents:
-                        content_path = Path(torrent["content_path"])
+                    if torrent.get("progress") == 1 and torrent_hash not in self.processed_torrents:
                         # Ensure we only process torrents inside the monitored path
-                        if str(content_path.resolve()).startswith(str(monitor_path.resolve())):
+                        torrent_path = torrent["content_path"]
+                        cached = in_monitor.get(torrent_hash)
+                        if cached is None or cached[0] != torrent_path:
+                            content_norm = os.path.normcase(os.path.normpath(torrent_path))
+                            inside = (
+                                (os.path.isabs(content_norm) and (content_norm == monitor_norm or content_norm.startswith(monitor_prefix)))
+                                # Fall back to resolving symlinks, relative paths etc.
+                                or _is_within(Path(torrent_path).resolve(), monitor_root)
+                            )
+                            cached = in_monitor[torrent_hash] = (torrent_path, inside)
+                        if cached[1]:
                             torrents_to_process.append(torrent)
                 
                 if torrents_to_process:
-                    self.logger.info(f"Found {len(torrents_to_process)} new completed torrent(s).")
+                    self.logger.info("Found %s new completed torrent(s).", len(torrents_to_process))
                     for i, torrent in enumerate(torrents_to_process):
+                        if self._stop_event.is_set():
+                            break # Leave the rest for the next start
+                        if not self.processed_torrents.claim(torrent['hash']):
+                            continue # Already being unpacked elsewhere
                         content_path = Path(torrent["content_path"])
                         self.gui_queue.put(('status', f"Processing ({i+1}/{len(torrents_to_process)}): {torrent['name']}"))
-                        self.processed_torrents.add(torrent['hash'])
                         
                         try:
                             # Using pause_torrents which is the correct v2 API method name
                             qbt_client.torrents_pause(torrent_hashes=[torrent['hash']])
-                            self.logger.info(f"Paused torrent: {torrent['name']}")
+                            self.logger.info("Paused torrent: %s", torrent['name'])
                         except Exception as e:
-                            self.logger.error(f"Failed to pause torrent '{torrent['name']}': {e}. Proceeding anyway.")
+                            self.logger.error("Failed to pause torrent '%s': %s. Proceeding anyway.", torrent['name'], e)
                         
-                        unpacker.unpack_archives(content_path)
+                        try:
+                            try:
+                                unpacker.unpack_archives(content_path)
+                            except Exception as e:
+                                unpack_failures[torrent['hash']] += 1
+                                attempts = unpack_failures[torrent['hash']]
+                                if attempts < MAX_UNPACK_ATTEMPTS:
+                                    self.logger.error("Unpacking '%s' failed (attempt %s of %s): %s", torrent['name'], attempts, MAX_UNPACK_ATTEMPTS, e, exc_info=True)
+                                    continue
+                                self.logger.error("Unpacking '%s' failed %s times, giving up: %s", torrent['name'], attempts, e, exc_info=True)
+                            # Only remembered once unpacking has finished, so an
+                            # extraction cut short by a crash or Quit is retried
+                            # after a restart. Failed extractions are logged by
+                            # unpack_archives and still count as processed.
+                            unpack_failures.pop(torrent['hash'], None)
+                            self.processed_torrents.add(torrent['hash'])
+                        finally:
+                            self.processed_torrents.release(torrent['hash'])
                     
                     self.gui_queue.put(('status', "Monitoring...")) # Reset status after processing batch
 
             except Exception as e:
-                self.logger.error(f"An error occurred during polling: {e}", exc_info=True)
+                self.logger.error("An error occurred during polling: %s", e, exc_info=True)
                 self.gui_queue.put(('status', "Error during polling. Retrying..."))
                 # Wait longer after an error to avoid spamming logs
                 self._stop_event.wait(60) 
+                # Request a full update next time in case sync state was lost.
+                rid = 0
                 continue
 
-            # Wait for 15 seconds before the next poll.
+            # Only deltas are transferred, so polling every second is cheap.
             # wait() is used instead of sleep() to make stopping more responsive.
-            self._stop_event.wait(15)
+            self._stop_event.wait(1)
 
         self.logger.info("Monitoring stopped.")
 
@@ -261,38 +740,73 @@ class MainApp(tk.Tk):
 
         self.config = configparser.ConfigParser()
         self.monitor_thread = None
-        self.processed_torrents = set()
+        # Kept on disk so torrents finished before a restart are not extracted again
+        self.processed_torrents = ProcessedStore(PROCESSED_DB_FILE)
         self.extraction_history = []
         self.log_window = None
         self.log_text_widget = None
-        self._save_job = None
         self.tray_icon = None
-
-        self.gui_queue = queue.Queue()
-        self.queue_handler = QueueHandler(self.gui_queue)
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S')
-        self.queue_handler.setFormatter(formatter)
-        self.logger = logging.getLogger()
-        self.logger.setLevel(logging.INFO)
-        for handler in self.logger.handlers[:]:
-            self.logger.removeHandler(handler)
-        self.logger.addHandler(self.queue_handler)
+        self._wshell = None
+        self._startup_q = queue.Queue()
+        self._startup_thread = None
+
+        # Producers only set an event when they queue something; the Tk thread
+        # checks it cheaply and drains the queues when it is set. Worker
+        # threads never call into Tk themselves, since cross-thread Tk calls
+        # block until the Tk thread services them.
+        self._gui_wakeup = threading.Event()
+        self.gui_queue = GuiQueue(self._gui_wakeup.set)
+        # Log records get their own queue and are only formatted on the Tk
+        # thread, when a whole batch of them is inserted into the log view.
+        self._log_queue = GuiQueue(self._gui_wakeup.set)
+        self._log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S')
+        self.queue_handler = RawQueueHandler(self._log_queue)
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+        root_logger.addHandler(self.queue_handler)
+        # The app and its worker threads log through a named logger so
+        # handlers and filters can be scoped to AutoUnpack's own records.
+        self.logger = logging.getLogger(__name__)
+
+        self.history_writer = _HistoryWriter(EXTRACTION_LOG_FILE, self.logger)
+        self.history_writer.start()
+
+        # Settings edits are debounced on the Tk thread and then written by a
+        # background thread. The queue holds at most one wake-up token; the
+        # writer always saves the latest (generation, config) snapshot.
+        self._save_after_id = None
+        self._save_q = queue.Queue(maxsize=1)
+        self._pending_config = None
+        # Guards handing _pending_config between the Tk and writer threads
+        self._pending_config_lock = threading.Lock()
+        self._config_write_lock = threading.Lock()
+        # Every snapshot is numbered; older ones never overwrite newer ones.
+        self._config_generation = 0
+        self._written_generation = 0
+        threading.Thread(target=self._run_config_writer, daemon=True).start()
         
         self._create_widgets()
         self.load_config()
         self._load_extraction_history()
-        self._create_icon_file_if_needed()
         self._setup_window_icon()
-        self._setup_system_tray()
+        # The tray needs pystray and Pillow, which are slow to import; let
+        # the window appear first.
+        self.after_idle(self._setup_system_tray)
 
         if self.start_on_launch.get():
             self.after(500, self.start_monitoring)
 
-        self.after(100, self._poll_gui_queue)
+        self._gui_wakeup.set() # Show anything logged during startup
+        self.after(0, self._watch_gui_queue)
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
         self.bind("<Unmap>", self._on_minimize)
 
     def _create_widgets(self):
+        # Shared options for every text entry in the settings panel
+        self._entry_kw = dict(background=self.style.COLOR_MEDIUM_GRAY, foreground=self.style.COLOR_WHITE, insertbackground=self.style.COLOR_WHITE, borderwidth=2, relief="flat")
+
         main_frame = ttk.Frame(self, padding="10")
         main_frame.pack(fill="both", expand=True)
 
@@ -305,25 +819,25 @@ class MainApp(tk.Tk):
         self.qbt_host_var = tk.StringVar()
         self.qbt_host_var.trace_add("write", self._schedule_save)
         ttk.Label(qbit_frame, text="Host:").grid(row=0, column=0, sticky="w", pady=(0, 2))
-        self.qbt_host = tk.Entry(qbit_frame, textvariable=self.qbt_host_var, background=self.style.COLOR_MEDIUM_GRAY, foreground=self.style.COLOR_WHITE, insertbackground=self.style.COLOR_WHITE, borderwidth=2, relief="flat")
+        self.qbt_host = tk.Entry(qbit_frame, textvariable=self.qbt_host_var, **self._entry_kw)
         self.qbt_host.grid(row=0, column=1, sticky="ew", pady=(0, 2))
 
         self.qbt_port_var = tk.StringVar()
         self.qbt_port_var.trace_add("write", self._schedule_save)
         ttk.Label(qbit_frame, text="Port:").grid(row=1, column=0, sticky="w", pady=(0, 2))
-        self.qbt_port = tk.Entry(qbit_frame, textvariable=self.qbt_port_var, background=self.style.COLOR_MEDIUM_GRAY, foreground=self.style.COLOR_WHITE, insertbackground=self.style.COLOR_WHITE, borderwidth=2, relief="flat")
+        self.qbt_port = tk.Entry(qbit_frame, textvariable=self.qbt_port_var, **self._entry_kw)
         self.qbt_port.grid(row=1, column=1, sticky="ew", pady=(0, 2))
 
         self.qbt_user_var = tk.StringVar()
         self.qbt_user_var.trace_add("write", self._schedule_save)
         ttk.Label(qbit_frame, text="Username:").grid(row=2, column=0, sticky="w", pady=(0, 2))
-        self.qbt_user = tk.Entry(qbit_frame, textvariable=self.qbt_user_var, background=self.style.COLOR_MEDIUM_GRAY, foreground=self.style.COLOR_WHITE, insertbackground=self.style.COLOR_WHITE, borderwidth=2, relief="flat")
+        self.qbt_user = tk.Entry(qbit_frame, textvariable=self.qbt_user_var, **self._entry_kw)
         self.qbt_user.grid(row=2, column=1, sticky="ew", pady=(0, 2))
 
         self.qbt_pass_var = tk.StringVar()
         self.qbt_pass_var.trace_add("write", self._schedule_save)
         ttk.Label(qbit_frame, text="Password:").grid(row=3, column=0, sticky="w", pady=(0, 2))
-        self.qbt_pass = tk.Entry(qbit_frame, show="*", textvariable=self.qbt_pass_var, background=self.style.COLOR_MEDIUM_GRAY, foreground=self.style.COLOR_WHITE, insertbackground=self.style.COLOR_WHITE, borderwidth=2, relief="flat")
+        self.qbt_pass = tk.Entry(qbit_frame, show="*", textvariable=self.qbt_pass_var, **self._entry_kw)
         self.qbt_pass.grid(row=3, column=1, sticky="ew")
 
         folder_frame = ttk.LabelFrame(settings_frame, text="Folders", padding=(10, 5))
@@ -333,14 +847,14 @@ class MainApp(tk.Tk):
         ttk.Label(folder_frame, text="Monitor Folder:").grid(row=0, column=0, sticky="w", columnspan=2)
         self.monitor_path_var = tk.StringVar()
         self.monitor_path_var.trace_add("write", self._schedule_save)
-        self.monitor_path = tk.Entry(folder_frame, width=30, textvariable=self.monitor_path_var, background=self.style.COLOR_MEDIUM_GRAY, foreground=self.style.COLOR_WHITE, insertbackground=self.style.COLOR_WHITE, borderwidth=2, relief="flat")
+        self.monitor_path = tk.Entry(folder_frame, width=30, textvariable=self.monitor_path_var, **self._entry_kw)
         self.monitor_path.grid(row=1, column=0, sticky="ew", pady=(2, 0))
         ttk.Button(folder_frame, text="Browse...", command=self._browse_monitor_folder).grid(row=1, column=1, padx=(5,0), pady=(2, 0))
 
         ttk.Label(folder_frame, text="7-Zip Path (7z.exe):").grid(row=2, column=0, sticky="w", columnspan=2, pady=(5,0))
         self.seven_zip_path_var = tk.StringVar()
         self.seven_zip_path_var.trace_add("write", self._schedule_save)
-        self.seven_zip_path = tk.Entry(folder_frame, width=30, textvariable=self.seven_zip_path_var, background=self.style.COLOR_MEDIUM_GRAY, foreground=self.style.COLOR_WHITE, insertbackground=self.style.COLOR_WHITE, borderwidth=2, relief="flat")
+        self.seven_zip_path = tk.Entry(folder_frame, width=30, textvariable=self.seven_zip_path_var, **self._entry_kw)
         self.seven_zip_path.grid(row=3, column=0, sticky="ew", pady=(2, 0))
         ttk.Button(folder_frame, text="Browse...", command=self._browse_7zip).grid(row=3, column=1, padx=(5,0), pady=(2, 0))
 
@@ -429,8 +943,7 @@ class MainApp(tk.Tk):
         log_frame = ttk.Frame(self.log_window, padding="10")
         log_frame.pack(fill="both", expand=True)
         
-        self.log_text_widget = scrolledtext.ScrolledText(log_frame, 
-            state="disabled", 
+        self.log_text_widget = ReadOnlyScrolledText(log_frame,
             wrap=tk.WORD,
             background=self.style.COLOR_MEDIUM_GRAY,
             foreground=self.style.COLOR_LIGHT_GRAY
@@ -444,10 +957,51 @@ class MainApp(tk.Tk):
             self.log_window.withdraw()
 
     def _schedule_save(self, *args):
-        """Schedules a save operation, debouncing rapid changes."""
-        if self._save_job:
-            self.after_cancel(self._save_job)
-        self._save_job = self.after(1000, self.save_config) # 1 second delay
+        """Saves the settings once edits have stopped for CONFIG_SAVE_DELAY_MS."""
+        # Coalesces bursts of changes, e.g. typing, into a single snapshot
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(CONFIG_SAVE_DELAY_MS, self._queue_config_snapshot)
+
+    def _cancel_scheduled_save(self):
+        """Cancels a debounced save; returns True if one was pending."""
+        if self._save_after_id is None:
+            return False
+        self.after_cancel(self._save_after_id)
+        self._save_after_id = None
+        return True
+
+    def _take_config_snapshot(self, **values):
+        """Returns (generation, config) for the current widget values."""
+        # Tk variables may only be read on the Tk thread, so the writer
+        # thread always gets a ready-made snapshot.
+        self._config_generation += 1
+        return self._config_generation, self._build_config(**values)
+
+    def _queue_config_snapshot(self):
+        """Hands a snapshot of the current settings to the config writer thread."""
+        self._save_after_id = None
+        snapshot = self._take_config_snapshot()
+        with self._pending_config_lock:
+            self._pending_config = snapshot
+        try:
+            self._save_q.put_nowait(None)
+        except queue.Full:
+            pass # A save is already pending and will pick up this snapshot
+
+    def _run_config_writer(self):
+        """Background loop that writes scheduled config snapshots to disk."""
+        while True:
+            self._save_q.get()
+            with self._pending_config_lock:
+                snapshot, self._pending_config = self._pending_config, None
+            if snapshot is None:
+                continue
+            try:
+                if self._write_config_file(*snapshot):
+                    self.logger.info("Configuration saved.")
+            except (OSError, ValueError) as e:
+                self.logger.error("Failed to save configuration: %s", e)
 
     def _browse_monitor_folder(self):
         path = filedialog.askdirectory(title="Select Folder to Monitor")
@@ -464,38 +1018,59 @@ class MainApp(tk.Tk):
     def _update_startup_setting(self, *args):
         if not IS_WINDOWS:
             return
-        
-        try:
-            startup_path = self._get_startup_folder()
-            shortcut_path = os.path.join(startup_path, "AutoUnpack.lnk")
 
-            if self.run_on_startup.get():
-                self.logger.info("Adding application to Windows startup.")
-                shell = win32com.client.Dispatch("WScript.Shell")
-                shortcut = shell.CreateShortCut(shortcut_path)
-                
-                # Use pythonw.exe to run without a console window
-                python_exe_path = sys.executable.replace("python.exe", "pythonw.exe")
-                script_path = os.path.abspath(__file__)
-                
-                shortcut.Targetpath = python_exe_path
-                shortcut.Arguments = f'"{script_path}"'
-                shortcut.WorkingDirectory = os.path.dirname(script_path)
-                shortcut.IconLocation = python_exe_path
-                shortcut.save()
-            else:
-                self.logger.info("Removing application from Windows startup.")
-                if os.path.exists(shortcut_path):
-                    os.remove(shortcut_path)
+        # Creating the COM shell object and the shortcut is slow, so it is done
+        # on a worker thread. COM objects belong to the thread that created
+        # them, so one long-lived thread is reused for every change.
+        if self._startup_thread is None:
+            self._startup_thread = threading.Thread(target=self._run_startup_worker, daemon=True)
+            self._startup_thread.start()
+        self._startup_q.put(self.run_on_startup.get())
+
+    def _run_startup_worker(self):
+        """Applies queued 'Run on Windows startup' changes off the Tk thread."""
+        pythoncom.CoInitialize()
+        while True:
+            enabled = self._startup_q.get()
+            try:
+                self._apply_startup_setting(enabled)
+            except Exception as e:
+                self.logger.error("Failed to update startup setting: %s", e, exc_info=True)
+                self.gui_queue.put(('startup_error', str(e)))
 
-        except Exception as e:
-            self.logger.error(f"Failed to update startup setting: {e}", exc_info=True)
-            messagebox.showerror("Startup Error", f"Failed to update Windows startup setting:\n{e}")
+    def _apply_startup_setting(self, enabled):
+        startup_path = self._get_startup_folder()
+        shortcut_path = os.path.join(startup_path, "AutoUnpack.lnk")
+
+        if enabled:
+            self.logger.info("Adding application to Windows startup.")
+            shortcut = self._wsh().CreateShortCut(shortcut_path)
+            
+            # Use pythonw.exe to run without a console window
+            python_exe_path = sys.executable.replace("python.exe", "pythonw.exe")
+            script_path = os.path.abspath(__file__)
+            
+            shortcut.Targetpath = python_exe_path
+            shortcut.Arguments = f'"{script_path}"'
+            shortcut.WorkingDirectory = os.path.dirname(script_path)
+            shortcut.IconLocation = python_exe_path
+            shortcut.save()
+        else:
+            self.logger.info("Removing application from Windows startup.")
+            try:
+                os.remove(shortcut_path)
+            except FileNotFoundError:
+                pass
+
+    def _wsh(self):
+        """Returns the cached WScript.Shell object (startup worker thread only)."""
+        if self._wshell is None:
+            self._wshell = win32com.client.Dispatch("WScript.Shell")
+        return self._wshell
 
     def _get_startup_folder(self):
         if IS_WINDOWS:
-            shell = win32com.client.Dispatch("WScript.Shell")
-            return shell.SpecialFolders("Startup")
+            return self._wsh().SpecialFolders("Startup")
         return None
 
     def _on_history_select(self, event=None):
@@ -526,32 +1101,54 @@ class MainApp(tk.Tk):
 
     def _load_extraction_history(self):
         self.extraction_history = []
-        if Path(EXTRACTION_LOG_FILE).exists():
-            with open(EXTRACTION_LOG_FILE, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    parts = line.split(':', 2)
-                    if len(parts) < 3: continue
-                    
-                    status, name, path = parts
-                    self.extraction_history.append((status, name, path))
+        try:
+            with open(EXTRACTION_LOG_FILE, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+
+        # Parse in bytes and only decode the individual fields. The log is
+        # written in text mode, so it uses the locale's preferred encoding.
+        encoding = locale.getpreferredencoding(False)
+        for line in data.split(b'\n'):
+            line = line.strip()
+            if not line:
+                continue
+
+            status, _, rest = line.partition(b':')
+            name, sep, path = rest.partition(b':')
+            if not sep: continue
+
+            self.extraction_history.append((
+                status.decode(encoding, errors='replace'),
+                name.decode(encoding, errors='replace'),
+                path.decode(encoding, errors='replace'),
+            ))
+
+        if not self.extraction_history:
+            return
 
-                    self.history_listbox.insert(tk.END, name)
-                    idx = self.history_listbox.size() - 1
-                    if status == 'SUCCESS':
-                        self.history_listbox.itemconfig(idx, {'bg': self.style.success_color, 'fg': self.style.COLOR_DARK_GRAY})
-                    elif status == 'FAILURE':
-                        self.history_listbox.itemconfig(idx, {'bg': self.style.error_color, 'fg': self.style.COLOR_DARK_GRAY})
+        self._add_history_rows(self.extraction_history)
+
+    def _add_history_rows(self, entries):
+        """Appends and colours (status, name, path) entries in one Tcl call."""
+        colors = {
+            'SUCCESS': (self.style.success_color, self.style.COLOR_DARK_GRAY),
+            'FAILURE': (self.style.error_color, self.style.COLOR_DARK_GRAY),
+        }
+        rows = []
+        for status, name, _ in entries:
+            rows.extend((name, *colors.get(status, ("", ""))))
+        # Values are passed as a Tcl list rather than spliced into the script,
+        # so names need no quoting.
+        self.tk.call('apply', HISTORY_INSERT_LAMBDA, str(self.history_listbox), tuple(rows))
 
     def _clear_extraction_history(self):
         if messagebox.askyesno("Clear History", "Are you sure you want to permanently delete the extraction history log?\n\n(This will not delete any extracted files.)"):
             self.history_listbox.delete(0, tk.END)
             self.extraction_history = []
-            if Path(EXTRACTION_LOG_FILE).exists():
-                os.remove(EXTRACTION_LOG_FILE)
+            # Removed by the writer thread, so queued lines cannot recreate it
+            self.history_writer.clear()
             self.logger.info("Extraction history log cleared.")
             self._on_history_select()
 
@@ -578,31 +1175,27 @@ class MainApp(tk.Tk):
         deleted_count = 0
         failed_count = 0
         
-        # Make a copy for safe iteration while modifying the original
-        history_to_delete = list(self.extraction_history)
-
-        for _, _, path_str in history_to_delete:
-            try:
-                path = Path(path_str)
-                if path.is_dir():
-                    import shutil
-                    shutil.rmtree(path)
-                    self.logger.info(f"Deleted folder: {path}")
-                    deleted_count += 1
-                elif path.exists():
-                    # Handle cases where the path might be a file (less likely)
-                    os.remove(path)
-                    self.logger.info(f"Deleted file: {path}")
-                    deleted_count += 1
-            except Exception as e:
-                self.logger.error(f"Failed to delete '{path_str}': {e}")
+        # Deletions run in parallel, so drop duplicate paths and paths nested
+        # inside another one; those would otherwise race with each other.
+        unique_paths = {os.path.normpath(path_str) for _, _, path_str in self.extraction_history}
+        paths_to_delete = [p for p in unique_paths
+                           if not any(str(parent) in unique_paths for parent in Path(p).parents)]
+
+        with ThreadPoolExecutor(max_workers=MAX_DATA_DELETE_WORKERS) as pool:
+            results = list(pool.map(_delete_path, paths_to_delete))
+
+        for path_str, (kind, error) in zip(paths_to_delete, results):
+            if error:
+                self.logger.error("Failed to delete '%s': %s", path_str, error)
                 failed_count += 1
+            elif kind:
+                self.logger.info("Deleted %s: %s", kind, path_str)
+                deleted_count += 1
         
         # Clear the in-app history and log file
         self.history_listbox.delete(0, tk.END)
         self.extraction_history = []
-        if Path(EXTRACTION_LOG_FILE).exists():
-            os.remove(EXTRACTION_LOG_FILE)
+        self.history_writer.clear()
         
         self.logger.info("All data deletion process complete.")
         
@@ -640,32 +1233,95 @@ class MainApp(tk.Tk):
             
         self.logger.info("Configuration loaded.")
 
-    def save_config(self):
-        self.config['qBittorrent'] = {'host': self.qbt_host_var.get(), 'port': self.qbt_port_var.get(), 'username': self.qbt_user_var.get(), 'password': self.qbt_pass_var.get()}
-        self.config['Folders'] = {'monitor_path': self.monitor_path_var.get(), 'seven_zip_path': self.seven_zip_path_var.get()}
-        self.config['General'] = {
+    def _build_config(self, host=None, port=None, monitor_path=None, seven_zip_path=None):
+        """Returns a copy of self.config updated with the current widget values.
+
+        Values the caller has already read from their Tk variables can be
+        passed in so they are not looked up a second time.
+        """
+        if host is None:
+            host = self.qbt_host_var.get()
+        if port is None:
+            port = self.qbt_port_var.get()
+        if monitor_path is None:
+            monitor_path = self.monitor_path_var.get()
+        if seven_zip_path is None:
+            seven_zip_path = self.seven_zip_path_var.get()
+        config = configparser.ConfigParser()
+        config.read_dict(self.config)
+        config['qBittorrent'] = {'host': host, 'port': port, 'username': self.qbt_user_var.get(), 'password': self.qbt_pass_var.get()}
+        config['Folders'] = {'monitor_path': monitor_path, 'seven_zip_path': seven_zip_path}
+        config['General'] = {
             'delete_on_success': str(self.delete_on_success.get()),
             'start_on_launch': str(self.start_on_launch.get()),
             'create_subfolder': str(self.create_subfolder.get()),
             'run_on_startup': str(self.run_on_startup.get())
             }
-        with open(CONFIG_FILE, 'w') as configfile:
-            self.config.write(configfile)
-        self.logger.info("Configuration saved.")
+        return config
+
+    def _write_config_file(self, generation, config):
+        """Writes config to a temporary file and atomically swaps it into place.
+
+        Returns False without touching the disk if CONFIG_FILE already holds
+        exactly the same settings, or if a newer snapshot than generation
+        has already been written.
+        """
+        # configparser issues many tiny write() calls, so render into memory
+        # and write the result in one go. Newlines and encoding match what a
+        # text-mode file would have produced.
+        buf = io.StringIO()
+        config.write(buf)
+        new_data = buf.getvalue().replace('\n', os.linesep).encode(locale.getpreferredencoding(False))
+
+        tmp_path = CONFIG_FILE + ".tmp"
+        with self._config_write_lock:
+            if generation < self._written_generation:
+                return False # A newer snapshot is already on disk
+            self._written_generation = generation
+            try:
+                with open(CONFIG_FILE, 'rb') as configfile:
+                    if configfile.read() == new_data:
+                        return False
+            except OSError:
+                pass # Missing or unreadable; just write it
+
+            with open(tmp_path, 'wb') as configfile:
+                configfile.write(new_data)
+                # Make sure the data is on disk before the rename, otherwise a
+                # crash could still leave an empty config.ini behind.
+                configfile.flush()
+                os.fsync(configfile.fileno())
+            os.replace(tmp_path, CONFIG_FILE)
+        return True
+
+    def save_config(self, **values):
+        self._cancel_scheduled_save() # Superseded by this save
+        generation, self.config = self._take_config_snapshot(**values)
+        if self._write_config_file(generation, self.config):
+            self.logger.info("Configuration saved.")
         return True
 
     def start_monitoring(self):
-        if not all([self.qbt_host_var.get(), self.qbt_port_var.get(), self.monitor_path_var.get(), self.seven_zip_path_var.get()]):
+        host = self.qbt_host_var.get()
+        port = self.qbt_port_var.get()
+        monitor_path = self.monitor_path_var.get()
+        seven_zip_path = self.seven_zip_path_var.get()
+        if not (host and port and monitor_path and seven_zip_path):
             messagebox.showerror("Error", "Please fill in all required fields.")
             return
 
-        if not self.save_config():
+        if self.monitor_thread and self.monitor_thread.is_alive():
+            # A stopped monitor finishes the torrent it is unpacking first
+            messagebox.showinfo("Please Wait", "The previous monitoring session is still finishing its current extraction. Please try again in a moment.")
+            return
+
+        if not self.save_config(host=host, port=port, monitor_path=monitor_path, seven_zip_path=seven_zip_path):
             return
 
         self.start_button.config(state="disabled")
         self.stop_button.config(state="normal")
         # self.scan_button.config(state="disabled") # No longer needed
-        self.monitor_thread = UnpackMonitorThread(self.config, self.logger, self.processed_torrents, self.gui_queue)
+        self.monitor_thread = UnpackMonitorThread(self.config, self.logger, self.processed_torrents, self.gui_queue, self.history_writer)
         self.monitor_thread.start()
 
     def stop_monitoring(self):
@@ -678,85 +1334,105 @@ class MainApp(tk.Tk):
 
     # The manual_scan and _run_manual_scan methods are no longer needed.
     
-    def _poll_gui_queue(self):
-        while True:
+    def _watch_gui_queue(self):
+        """Drains the GUI queues whenever a producer has signalled new messages."""
+        if self._gui_wakeup.is_set():
+            # Cleared first, so messages queued during the drain set it again
+            self._gui_wakeup.clear()
+            self._drain_gui_queue()
+        self.after(GUI_WAKEUP_INTERVAL_MS, self._watch_gui_queue)
+
+    def _drain_gui_queue(self):
+        # Drain what is queued (up to a limit, so a flood of messages cannot
+        # freeze the UI), then apply it to the widgets in as few Tk calls as
+        # possible: one insert for all log lines, one insert for all history
+        # rows and only the most recent status / progress state.
+        logs = []
+        history = []
+        last_status = None
+        last_progress = None
+        drained = False
+        logs_drained = True
+        for _ in range(GUI_DRAIN_LIMIT):
+            try:
+                record = self._log_queue.get_nowait()
+            except queue.Empty:
+                break
+            logs.append(self._log_formatter.format(record))
+        else:
+            logs_drained = False
+        for _ in range(GUI_DRAIN_LIMIT):
             try:
-                message_type, data = self.gui_queue.get(block=False)
+                message_type, data = self.gui_queue.get_nowait()
             except queue.Empty:
+                drained = True
                 break
             else:
-                if message_type == 'log':
-                    if self.log_window and self.log_window.winfo_exists() and self.log_text_widget:
-                        self.log_text_widget.config(state="normal")
-                        self.log_text_widget.insert(tk.END, data + '\n')
-                        self.log_text_widget.config(state="disabled")
-                        self.log_text_widget.see(tk.END)
-                elif message_type == 'status':
-                    self.status_label.config(text=data)
+                if message_type == 'status':
+                    last_status = data
                 elif message_type == 'progress':
-                    if data == 'start':
-                        self.progress_bar.start(10)
-                    elif data == 'stop':
-                        self.progress_bar.stop()
+                    last_progress = data
                 elif message_type == 'extraction_success':
                     name, path = data
-                    self.extraction_history.append(('SUCCESS', name, path))
-                    self.history_listbox.insert(tk.END, name)
-                    self.history_listbox.itemconfig(self.history_listbox.size() - 1, {'bg': self.style.success_color, 'fg': self.style.COLOR_DARK_GRAY})
+                    history.append(('SUCCESS', name, path))
                 elif message_type == 'extraction_failure':
                     name, path = data
-                    self.extraction_history.append(('FAILURE', name, path))
-                    self.history_listbox.insert(tk.END, name)
-                    self.history_listbox.itemconfig(self.history_listbox.size() - 1, {'bg': self.style.error_color, 'fg': self.style.COLOR_DARK_GRAY})
+                    history.append(('FAILURE', name, path))
+                elif message_type == 'startup_error':
+                    messagebox.showerror("Startup Error", f"Failed to update Windows startup setting:\n{data}")
+
+        if logs and self.log_window and self.log_window.winfo_exists() and self.log_text_widget:
+            self.log_text_widget.insert(tk.END, '\n'.join(logs) + '\n')
+            self.log_text_widget.see(tk.END)
+        if last_status is not None:
+            self.status_label.config(text=last_status)
+        if last_progress == 'start':
+            self.progress_bar.start(10)
+        elif last_progress == 'stop':
+            self.progress_bar.stop()
+        if history:
+            self.extraction_history.extend(history)
+            self._add_history_rows(history)
                         
-        self.after(100, self._poll_gui_queue)
-
-    def _create_icon_file_if_needed(self):
-        """Generates a permanent icon.ico file if one doesn't already exist."""
-        icon_path = "icon.ico"
-        if not os.path.exists(icon_path):
-            self.logger.info("Generating permanent icon file (icon.ico)...")
-            try:
-                width = 64
-                height = 64
-                background_color = (45, 45, 45)
-                text_color = (0, 191, 255)
-                image = Image.new('RGB', (width, height), background_color)
-                draw = ImageDraw.Draw(image)
-                try:
-                    font = ImageFont.truetype("arialbd.ttf", 42)
-                except IOError:
-                    font = ImageFont.load_default()
-                text = "AE"
-                try:
-                    text_bbox = draw.textbbox((0, 0), text, font=font)
-                    text_width = text_bbox[2] - text_bbox[0]
-                    text_height = text_bbox[3] - text_bbox[1]
-                    position = ((width - text_width) / 2, (height - text_height) / 2 - 5)
-                    draw.text(position, text, font=font, fill=text_color)
-                except AttributeError:
-                    text_width, text_height = draw.textsize(text, font)
-                    position = ((width - text_width) / 2, (height - text_height) / 2)
-                    draw.text(position, text, font=font, fill=text_color)
-                
-                # Save as a multi-resolution ICO file
-                image.save(icon_path, format="ICO", sizes=[(16, 16), (32, 32), (48, 48), (64, 64)])
-            except Exception as e:
-                self.logger.error(f"Failed to generate icon.ico: {e}", exc_info=True)
+        if not (drained and logs_drained):
+            # Hit the drain limit; continue on the next check
+            self._gui_wakeup.set()
 
     def _setup_window_icon(self):
-        """Creates and sets the main window icon from the permanent icon file."""
+        """Sets the main window icon from the embedded icon data."""
         try:
-            icon_path = "icon.ico"
-            if os.path.exists(icon_path):
+            if IS_WINDOWS:
+                # iconbitmap() needs a real .ico file; only write one if the
+                # shipped icon.ico is missing.
+                icon_path = "icon.ico"
+                try:
+                    os.stat(icon_path)
+                except FileNotFoundError:
+                    icon_path = os.path.join(tempfile.gettempdir(), "autounpack.ico")
+                    icon_bytes = _get_icon_bytes()
+                    # A copy from an earlier run is reused if it is identical,
+                    # rather than rewriting the file on every launch.
+                    try:
+                        with open(icon_path, 'rb') as f:
+                            up_to_date = f.read() == icon_bytes
+                    except FileNotFoundError:
+                        up_to_date = False
+                    if not up_to_date:
+                        with open(icon_path, 'wb') as f:
+                            f.write(icon_bytes)
                 self.iconbitmap(icon_path)
+            else:
+                # Keep a reference so the image is not garbage collected
+                self._icon_photo = tk.PhotoImage(master=self, data=_get_icon_png_b64())
+                self.wm_iconphoto(True, self._icon_photo)
         except Exception as e:
-            self.logger.warning(f"Could not create or set window icon: {e}")
+            self.logger.warning("Could not create or set window icon: %s", e)
 
     def _setup_system_tray(self):
         """Sets up the system tray icon and its thread."""
         try:
-            image = Image.open("icon.ico")
+            import pystray # Imported lazily, only once the window is up
+            image = _get_icon_image()
             menu = (
                 pystray.MenuItem('Show', self._show_window, default=True),
                 pystray.MenuItem('Quit', self._quit_application)
@@ -766,7 +1442,7 @@ class MainApp(tk.Tk):
             # Run the icon in a separate thread
             threading.Thread(target=self.tray_icon.run, daemon=True).start()
         except Exception as e:
-            self.logger.error(f"Failed to create system tray icon: {e}", exc_info=True)
+            self.logger.error("Failed to create system tray icon: %s", e, exc_info=True)
 
     def _show_window(self):
         """Shows the main application window."""
@@ -775,12 +1451,32 @@ class MainApp(tk.Tk):
 
     def _quit_application(self):
         """Stops all processes and quits the application."""
+        # Signal the monitor first so it winds down while the tray icon and
+        # the settings are taken care of; the join below then rarely waits.
+        monitor_running = self.monitor_thread and self.monitor_thread.is_alive()
+        if monitor_running:
+            self.monitor_thread.stop()
+
         if self.tray_icon:
             self.tray_icon.stop()
-        
-        if self.monitor_thread and self.monitor_thread.is_alive():
-            self.monitor_thread.stop()
+
+        # Write settings that the config writer has not picked up yet
+        with self._pending_config_lock:
+            snapshot, self._pending_config = self._pending_config, None
+        if self._cancel_scheduled_save():
+            snapshot = self._take_config_snapshot() # Edits still being debounced
+        if snapshot is not None:
+            try:
+                self._write_config_file(*snapshot)
+            except OSError as e:
+                self.logger.error("Failed to save configuration: %s", e)
+
+        if monitor_running:
             self.monitor_thread.join(timeout=2) # Wait for thread to finish
+
+        # Flush any history lines that are still queued
+        self.history_writer.stop()
+        self.history_writer.join(timeout=2)
         
         self.destroy()
 
@@ -791,8 +1487,11 @@ class MainApp(tk.Tk):
             self.withdraw()
 
     def _on_closing(self):
+        if not self.tray_icon:
+            # Without a tray icon there would be no way to bring the window back
+            self._quit_application()
+            return
         # Hide the window to the system tray instead of closing it
-        self.iconify()
         self.withdraw()
         self.tray_icon.notify("AutoUnpack is still running in the background.", "AutoUnpack")
 
@@ -1,5 +1,93 @@
 from tkinter import ttk
 
+# AutoUnpack's multi-resolution (16-64 px) application icon. It is embedded so
+# it never has to be generated or read from disk at startup.
+ICON_ICO_B64 = (
+    b"AAABAAQAEBAAAAAAIABEAgAARgAAACAgAAAAACAAhgQAAIoCAAAwMAAAAAAgANQGAAAQBwAA"
+    b"QEAAAAAAIAB5AwAA5A0AAIlQTkcNChoKAAAADUlIRFIAAAAQAAAAEAgCAAAAkJFoNgAAAgtJ"
+    b"REFUeJydUktoE1EUff+ZScdk8tFAglAqVKQMKV0UKu2qqSJIsat2J4Iu3IkbBffiogvpQu1G"
+    b"cONKqaC1ggtBikqtaBH8VAWbgkjSkMSkk0zmzbvl9UOx4KJe7uK9c8+5j3vPw67rov0E2Rcb"
+    b"/YeA7R4x1gmgcxvZ0w4QwI4AYxz4WEpgHLjY1ADxPaRCDGqbzIUSphYAIdSrVwbGyqcnUjP3"
+    b"nHdzyogoEVk5f1M6KcUsrELooM780/TjKS3AAMBFafhcs6sHRnjsw3MECgj5kxs2fv+ILr0A"
+    b"YSKBRHEFEcZ0+2ajcex4K3s0c/fGr/Gr3pE++8sbZdpIgbPwpHP6UhCLExnKA/GwwyEIESzb"
+    b"5cFxsVZIz07xaqk8NIGlD5TTVn1t5OzS9NdPkwsf77yv5fK0WWdE+kEiU+vN28tv17v7RalQ"
+    b"6zvRTmZx0ALKjdJP+/NrxU3EEVuvAmWMNOuV/lGIGl5X77crD0jQUlGzlssnXj1UphVbfNZ5"
+    b"+7KM2VhKGU3I6EGmhFU8eUGsrnZfH1PMwKFcvjZTPHXR0aOjysBoGIkpoV8wC9+TL++zduow"
+    b"88qJ+UesWgztOG1U07O3KkNn2smsszjXPpSp9wzqtVoUhRSrELuuS3wPKANuar+0gy0cSiUs"
+    b"Evh/GceYEhHtg96gBrYKANwEjhAoZUT+8TW2qLv4znUPvhkbKq72DsPvWbcAAAAASUVORK5C"
+    b"YIKJUE5HDQoaCgAAAA1JSERSAAAAIAAAACAIAgAAAPwY7aMAAARNSURBVHja7VbPb1RVFP7O"
+    b"vfe9mTc/OjNMWzDEH7XowtgKHaiJCxJk0fBTNy6M0aWJiVH5E0xca9yYrnQhbEGJBiImsFGo"
+    b"iGJMREBIUKAttp15M/Pem3nv3ntcTGk7w1gWyo6Tu7q573z3ft93znk0NjaGBxkCDzgeAjwE"
+    b"+O+h+u6ykCACAGayps8BqdbPS9aA+V8AiFRQI6PBsI5rvVzn6Jr0rOoL1LPZHSaTZ+EA3AeA"
+    b"jF7c+Wo8/CgE0n9eKVw4yY67isGWVWru4Hs27ZFhENADRABz6ewxt3qbhaN67k46iTc8cvO1"
+    b"D7ggICBnG7nfz4moASnBDCKybB13/uAhLhI0IO+9IGCRvTyTWrjB0u0CYBKyHfrbptgjqiYg"
+    b"MsW8v3X34JkjOlskNmsp0lSCZhFH3QQyiMBWJO2Og1SPMiaT9yf2wIH3128mW2yPPFbbcWDD"
+    b"90fJ2h6RWSkRR6Mfve4u3Wbl9OhEcWSdFNiKtdcX7TAYnYieeAaWSjNfFi5+A6JgSyV8YlzE"
+    b"IVMfT4t2JNqBaIfLqxWKdiiiJhlzTx0QwNav7OOMpKbJX/oue/U8WuCsqk3uJ6OXjdtj17Cm"
+    b"GkuqWe0sGVRVoyriCEJ01wGR0HFS3uyP74ZF+tZld/GmjBpqcUEPDfpbp4ZPTKtmtcf+LJz5"
+    b"fW/LsA4hlylihkve9UsDv3zb8Z5aI2/kv/CiLpdByF0+RzoRoZ/744faxr3J0FB9bNfg6cM6"
+    b"XyKjV+Rk6SwcfANrH2aBPApfnSz8+DW7KTCLu/Ja63q1HfshQc2kdPaYDH23Ols6+wUSBlCd"
+    b"fMmmvFUj3c0n79TlbE3O+XLWl7O+mluSt32n/ncXRSyEbAXBkxPhlgnETDqpTR7wK3vA1mSL"
+    b"FBtWMnxqWzDyXO7aBeukVjQTSXv0wz4uIqNtyoO1KxoQGV3bvpczkgJjM5k7r7y5wgMCUGI4"
+    b"J2uTB3JXZuCku1wUNWVYZ+WuBWAikOiUuABI6CQpbvS3TSEGkxBh2HmvnPXlvC+ikKVEDH/r"
+    b"VFLeTDq+bwcltrhLpmIpRFRvVPYkw5sAZK7/PDL9FkgAy92Uhbj+zmetx5/WQ2V/fPfQqU91"
+    b"vrwqgpczmYE+haZjSmIQKWILqWqVvWQ1C1G8eMpdvKVzGzpdmoVUzWrxpxNzI1sosbXKvsEz"
+    b"R8gasoa0ZqGuHfq8NzUbzsqNR6eHT3yi82UlWmEwWqk/vwsuUMfAr6eNl4cQ3CkrIpPOFi6e"
+    b"mnv5Xc6JYPuOxrM7s1fPJ4VBDAAaRjq9BFkgD50rwZqOyAQhho9Pw7KzNO8s3mTpYKXzMLNy"
+    b"3Ts3Nh9+PykNkwKsJWs2Hf/Yum7/ds0Ml3KXZmwqQ9bS2Pi4iFuiFYCIpTLewD1fAICM6mQM"
+    b"GDblWdeTQXW9gdM5lvLArMBs3bRJZ9cZkAB0ttTpRWQt2OqBwfuNTAteqQPm1QawzoztnnoP"
+    b"/4v+r/gHFmlAntnbwLQAAAAASUVORK5CYIKJUE5HDQoaCgAAAA1JSERSAAAAMAAAADAIAgAA"
+    b"ANhgbtAAAAabSURBVHja7ZhLbJxXFcf/59zvNd88bMd2GyeOU5K4canHQSRO5dDQ2kpUCUKq"
+    b"KiyQKsGu3YCEYMsStrDqAgmEeHTBAqksQEJtWiqCyAOqJH04cXESmrpJTTzjeX+vew+LcRxn"
+    b"POOxWWXhT3cxoxnd+7vn/v/nnvNRPp/Ho/QwHrFnG2gbaBtoG2gbaBtoi4/V7Q8EJln9IoCY"
+    b"bntk2QpBy5zdgMRwo05GhEACYTau34WnXiFsCkkAEoiyjONtDkhEHK+6Ny+OQ8YIEweN1MLc"
+    b"RkEiqo5NiVKbQSJAGKpa8j6/CZEuQKKUVSkWD534z/d+BgVowAbK2P/TlzNzF7WXIaPXh1Ms"
+    b"78b3fys9BLOJEBkgjfT5S1947VVKYjBDxOq4U2OMmyqPPw8xXIyFFYyWnFOeOJG5dn4jVVYL"
+    b"CfdAAwQYQ6b5qd0aRkuoVLW4CVETUdQIhg5U8scRkrFdMJAwYpQnZgb++hu7cFdsZzXOD4WJ"
+    b"lbC1ohEf4m0YIR9JbmAzLhMCqmNTyeAOqhmKQ9KxTmcpMuHI3tr+w333/ihw0VkpJEZc9j9+"
+    b"P3f1HWO71FZ2IrDJ+ewWiQHRhkDGGDdVnDqDAOKys3gnd/Xs0sy3jbKhpXDsTM97f+nif6Ph"
+    b"cnru0u7Xf6T9XjJJJ1mL5Wg/t8LXHoiIkqh64HAwPAYtcMheXnzszV+WDn89enwIEWqjR4Pd"
+    b"B1O3PxSr/amt2tq4frxjl07l2jhgFWlFZ50ztTBzHBSmXhKHAEGM9L8vunfmvYVrIJBocVXh"
+    b"2Dc5bAhx91xjDER3GqR1C+u6CBFTFAY7R2ujz0AAYop17srbxkvnrpwtT0w3ISpf/Eo0OKIq"
+    b"BSir49kRKI6sWgkQbhuhlUybWmtDa314rLC2lJ+OH9+JQMNW3u1r7uJN46SyH53joGa8NEIT"
+    b"7dxTmpgZfOtXSba/vWCJkCDu31XOP2+8NNoCMTgMUgtza39tBaIkTrL9lfGvQoGMFlv1XHmb"
+    b"o1Asx6osZeYulr88TYkWm8v56b4Lb5CJ26YZYQt1lCZPlp492d6LAriwbv334E9e5EYZrJpy"
+    b"5JZ7keMgGB6rPv0M1Y0oCzHScxdIx6IUx2HP5bdgA8RomOr4sWD4KY4CMHc8sjDhQoOLQbtR"
+    b"52Jgl++12MJqvbzYKh06Ia5NtRgp27tx3VlaMG5KSIlS3qfXuFgzXpq0Ft8ufemkf+NyR6MJ"
+    b"xLPEszperS6iys7VDNQOSGud6Vk+cgoRAMBG7v2z6ZuXk3SfMmWCpOf/lfvg3eXjX0NFEGF5"
+    b"8vTgm79QtfL6IG0iMQoUqVKRkmgtk7XWXxw3lvOn4/7HoCFsoYHlyW/U9x8xtkNiAIaOo8ER"
+    b"hBBWMIh3DJQOnRx493XjZVq9tqnECCiV+L0ganPbC5EQlidPQQkSATE0oqE90Z49D1RJQAzE"
+    b"ABHEQNHy0VMD537frJb+n8QIIZ20KWGFWQW1+oEjtZE89P0AKiABGkBwfzQADahVOGqMPF0Z"
+    b"m1KNqrBqW99REpPeYCSdSlgiHVfGnzMDWapoUQoAhSF1kKM4LoQp0abXL4/PZD/8W/sSg1gs"
+    b"W5SNDXM6meThIyPiOIz6h0vjM4gBCCxkZi/u/fl3YaR1JRFYzvwPfxfs2gcDRFI+ND34zq/t"
+    b"pU/FslvL8bBuFz5jv95RQ00vpXvFstderkQ6rj+RD/Y9SYEBERz0XvqTVSmIk2p1NRHVy73n"
+    b"37j7rR9IDIokGh6ujU723fvkIXZWCFF7cnLh5R93LD/ue63v3B+cpYXmVd2spLRYTvHo6eZp"
+    b"iMXWvYI//56QElat9iEmkuzs3xfLrxrbFyNIpHDsTM8//0wmkQdaZYSoj+brG78yFMBB+qN/"
+    b"uHdviO2uAJHRUd9Q9anjFBpKYvh2ZvaCt3hL3LYlmBjb8+7MZ2cvlI8+R5VEQqv2xESwe9S/"
+    b"dRXkk9FkkpUStm6o2rGEbU4Gh9emIktYqaC6NP0dPZRGBIGCQub6ea6XktzAehdARJRtlZcy"
+    b"s+dKz85IjwIAV33+wiv7XntFmJPsDsk+KPKlayvkQJS9KgzKT0yQThq7D+p0lgyEiLT27nzM"
+    b"QRWkOkxIEG28bDB0QJQiaXZIQeqTD6Ds+t7xTbZBq5kndfs6NypgBYDy+TyIOKyT1kIgQEDi"
+    b"pITVhtsjMpqiRjPFrvSQXhpiOKgTttK7Cozrry7XFLUYNy20NjFIt2CLsDJ+dl1HTMbPbqmV"
+    b"blnOepBStzoNhIy0bRBo+3XMNtA20CMM9D/5+Jmdtn6fJQAAAABJRU5ErkJggolQTkcNChoK"
+    b"AAAADUlIRFIAAABAAAAAQAgCAAAAJQvmiQAAA0BJREFUeNrtmttP01Acx0/XsUG3tcUFdF5A"
+    b"NpAEHQyBjblIAkoAL1znm48mXh59MPFJXjXGmPhs4l+g0RgkghhJJBER2QQCIRpihASUtRu7"
+    b"sLm1PqDQC4OySdcl5zyt3538uk9/v+/vnNMMsVqtIJuHCmT5gAAQAAJAAAgAASAABIAAEAAC"
+    b"QAAIAAFSHGrpU5dbry2duyEQix/fxD2DEiNM3x1J5OnT+blHntwix/tTygCCUPWdYnnF5c6O"
+    b"EgqWO2P7Dm6tGw9nAYDP2Z0sM75TPUoHiOvIQGVjsm+p+k4WVSvaxLS9nUVzNi71MyNh80lG"
+    b"k/sXz2AMWBuJiYEUbl/e26rxLe55BnzOLu4lOdann3nPm+C6pNwSCpdURQ9YNmueYfCpYcLz"
+    b"hmflY45YQZFCAQT2xb5+QkO0YfIdkojzrOzsUSIAo8X81S1cBf8yBABAI6u6uVGRlXMUB0DX"
+    b"tDFajAfgfbv+gfAO8TqVPj9Q2aQ4AIpfGLkLMxtNA/cOAZbJuJW3a6NrptJw8QmuQvx7/AAA"
+    b"deAXNu8Nl9g2rVxWFy0o0v78Lv32s7390idbHlzG5r27yIB4icX5ZSPoRQBBfLJvjZICsGoN"
+    b"XXeBq2h8i7kLszweAQAAtENuKycF8Fc2JTBim8cPANCs/BAgxXWkv+qMIgConepny14kv5W3"
+    b"NnHMeChYZucqaIjGvo2LZ+KewaW261wlVFYXLTyqXZ6XZy+kTtI9uwGCcJWEjpx8OCF17+1y"
+    b"m57dz1gJsSoV5ehIJyhlb2fVmowBBCtO/yYK0wma0JF+29mMASQ9fO1myGZlIUDcYFw93pB+"
+    b"3JClJrrfnIEuRDk6WBXKVXRzo+ZHV3Z8ZzF755Xg1O9zuU1P78mdAaq+S6Dkj/XtHIZlydEX"
+    b"IitfZHO0smYgVFobLSzmPdl4DJd22M3/8Hy55Sq3+SYwwm9rJj++/F+bufXlqOJ2Q9IMiO1r"
+    b"mBpGI6tSQmtWFnSilU4GK28CJPIMAVtzKvXDSYLQyubqNZNFJgC69jzDL1k0EjRMDUuPRXx+"
+    b"rYpFRHtyt0wAlKh+cM8AEo/tIlY0LH47RNvbmb20MgL/cgYBIAAEgAAQAAJAAAiQveMPowEN"
+    b"i6gbDn0AAAAASUVORK5CYII="
+)
+
 class Style(ttk.Style):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -13,38 +101,43 @@ class Style(ttk.Style):
         self.COLOR_ERROR = "#e06c75"
         self.COLOR_WHITE = "#ffffff"
 
-        self.master.tk_setPalette(
-            background=self.COLOR_DARK_GRAY,
-            foreground=self.COLOR_LIGHT_GRAY,
-            activeBackground=self.COLOR_MEDIUM_GRAY,
-            activeForeground=self.COLOR_WHITE,
-            highlightColor=self.COLOR_ACCENT,
-            highlightBackground=self.COLOR_DARK_GRAY
-        )
-
-        self.configure("TFrame", background=self.COLOR_DARK_GRAY)
-        self.configure("TLabel", background=self.COLOR_DARK_GRAY, foreground=self.COLOR_LIGHT_GRAY, padding=5, font=("Segoe UI", 10))
-        self.configure("TCheckbutton", background=self.COLOR_DARK_GRAY, foreground=self.COLOR_LIGHT_GRAY, font=("Segoe UI", 10), indicatorrelief="flat")
-        self.map("TCheckbutton",
-                 foreground=[('active', self.COLOR_WHITE)],
-                 background=[('active', self.COLOR_MEDIUM_GRAY)])
-                 
-        self.configure("TButton", background=self.COLOR_ACCENT, foreground=self.COLOR_DARK_GRAY, padding=6, font=("Segoe UI", 10, "bold"), borderwidth=0)
-        self.map("TButton",
-                 background=[('active', self.COLOR_WHITE), ('disabled', self.COLOR_MEDIUM_GRAY)],
-                 foreground=[('active', self.COLOR_DARK_GRAY), ('disabled', self.COLOR_LIGHT_GRAY)])
-
-        self.configure("TLabelframe", background=self.COLOR_DARK_GRAY, bordercolor=self.COLOR_MEDIUM_GRAY, relief="solid", borderwidth=1)
-        self.configure("TLabelframe.Label", background=self.COLOR_DARK_GRAY, foreground=self.COLOR_ACCENT, font=("Segoe UI", 11, "bold"))
-        
-        self.configure("Vertical.TScrollbar", background=self.COLOR_DARK_GRAY, troughcolor=self.COLOR_MEDIUM_GRAY, bordercolor=self.COLOR_DARK_GRAY, arrowcolor=self.COLOR_LIGHT_GRAY)
-        
-        self.layout("Vertical.TScrollbar",
-            [('Vertical.Scrollbar.trough', {'children':
-                [('Vertical.Scrollbar.thumb', {'expand': '1', 'sticky': 'nswe'})],
-            'sticky': 'ns'})])
-            
-        self.configure("TProgressbar", thickness=10, background=self.COLOR_ACCENT, troughcolor=self.COLOR_MEDIUM_GRAY)
+        dark, medium, light = self.COLOR_DARK_GRAY, self.COLOR_MEDIUM_GRAY, self.COLOR_LIGHT_GRAY
+        accent, white = self.COLOR_ACCENT, self.COLOR_WHITE
+        # Options shared by the plain text widgets (labels and checkbuttons)
+        label_common = f"-background {dark} -foreground {light} -font {{{{Segoe UI}} 10}}"
+
+        # Everything is installed with a single Tcl script instead of one
+        # Python -> Tcl round trip per configure/map/layout call.
+        self.tk.eval(f"""
+            tk_setPalette background {dark} foreground {light} \\
+                activeBackground {medium} activeForeground {white} \\
+                highlightColor {accent} highlightBackground {dark}
+
+            ttk::style configure TFrame -background {dark}
+            ttk::style configure TLabel {label_common} -padding 5
+            ttk::style configure TCheckbutton {label_common} -indicatorrelief flat
+            ttk::style map TCheckbutton \\
+                -foreground {{active {white}}} \\
+                -background {{active {medium}}}
+
+            ttk::style configure TButton -background {accent} -foreground {dark} -padding 6 -font {{{{Segoe UI}} 10 bold}} -borderwidth 0
+            ttk::style map TButton \\
+                -background {{active {white} disabled {medium}}} \\
+                -foreground {{active {dark} disabled {light}}}
+
+            ttk::style configure TLabelframe -background {dark} -bordercolor {medium} -relief solid -borderwidth 1
+            ttk::style configure TLabelframe.Label -background {dark} -foreground {accent} -font {{{{Segoe UI}} 11 bold}}
+
+            ttk::style configure Vertical.TScrollbar -background {dark} -troughcolor {medium} -bordercolor {dark} -arrowcolor {light}
+
+            ttk::style layout Vertical.TScrollbar {{
+                Vertical.Scrollbar.trough -sticky ns -children {{
+                    Vertical.Scrollbar.thumb -expand 1 -sticky nswe
+                }}
+            }}
+
+            ttk::style configure TProgressbar -thickness 10 -background {accent} -troughcolor {medium}
+        """)
 
         # Custom Listbox styling (as it's not a ttk widget)
         self.listbox_bg = self.COLOR_MEDIUM_GRAY